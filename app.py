@@ -1,6 +1,9 @@
 import os
+import shutil
 import sqlite3
-from functools import wraps
+import threading
+from concurrent.futures import ThreadPoolExecutor, wait
+from functools import lru_cache, wraps
 from flask import Flask, render_template, request, redirect, url_for, flash, jsonify, session
 from werkzeug.utils import secure_filename
 from werkzeug.security import generate_password_hash, check_password_hash
@@ -26,31 +29,95 @@ os.makedirs(AUTH_DIR, exist_ok=True)
 # Initialize search engine
 search_engine = TfidfSearchEngine(folder_path=UPLOAD_FOLDER)
 
+# Background workers so upload requests can write files in parallel and
+# hand the index rebuild off instead of blocking the HTTP response on it;
+# the engine itself serializes concurrent index mutations
+executor = ThreadPoolExecutor(max_workers=4)
+
+
+def _rebuild_index():
+    """Rebuild the search index from a background worker"""
+    try:
+        search_engine.reload_documents()
+    except Exception as e:
+        print(f"Error rebuilding index in background: {e}")
+
+
+def _reserve_upload_path(original_filename):
+    """Resolve a unique destination name and create it exclusively.
+
+    Resolving via os.path.exists alone races with the parallel saves:
+    two same-named files in one batch would both resolve to the same
+    "unique" path and overwrite each other. Exclusive creation ('xb')
+    reserves the name on disk at resolution time.
+    """
+    filename = get_unique_filename(original_filename)
+    name, ext = os.path.splitext(filename)
+    attempt = 0
+    while True:
+        file_path = os.path.join(app.config['UPLOAD_FOLDER'], filename)
+        try:
+            return filename, open(file_path, 'xb')
+        except FileExistsError:
+            attempt += 1
+            filename = f"{name}_{attempt}{ext}"
+
+
+def _save_upload(file, dst):
+    """Stream an uploaded file into its reserved handle in 4MB chunks.
+
+    Werkzeug's file.save defaults to a 16KB buffer, which costs
+    thousands of read/write syscalls for uploads near the 200MB limit.
+    A failed save removes its partial output so a truncated file is
+    never left behind for the next index reload to pick up.
+    """
+    try:
+        with dst:
+            shutil.copyfileobj(file.stream, dst, length=4 * 1024 * 1024)
+    except BaseException:
+        try:
+            os.remove(dst.name)
+        except OSError:
+            pass
+        raise
+
 # -----------------------------
 # Helper: Database (SQLite)
 # -----------------------------
 
+# One persistent connection per thread: reopening the database per
+# request pays file-open and page-cache warmup every time for two tiny
+# queries. Each connection lives in thread-local storage and is closed
+# by garbage collection when its thread exits.
+_db_local = threading.local()
+
 def get_db_conn():
-    conn = sqlite3.connect(DB_PATH)
-    conn.row_factory = sqlite3.Row
+    conn = getattr(_db_local, 'conn', None)
+    if conn is None:
+        conn = sqlite3.connect(DB_PATH)
+        conn.row_factory = sqlite3.Row
+        # WAL lets readers run alongside a writer; NORMAL sync is safe
+        # with WAL and avoids an fsync per transaction
+        conn.execute('PRAGMA journal_mode=WAL')
+        conn.execute('PRAGMA synchronous=NORMAL')
+        conn.execute('PRAGMA mmap_size=268435456')
+        conn.execute('PRAGMA cache_size=-20000')
+        _db_local.conn = conn
     return conn
 
 def init_user_db():
     conn = get_db_conn()
-    try:
-        conn.execute(
-            """
-            CREATE TABLE IF NOT EXISTS users (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                username TEXT UNIQUE NOT NULL,
-                password_hash TEXT NOT NULL,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-            )
-            """
+    conn.execute(
+        """
+        CREATE TABLE IF NOT EXISTS users (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            username TEXT UNIQUE NOT NULL,
+            password_hash TEXT NOT NULL,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
         )
-        conn.commit()
-    finally:
-        conn.close()
+        """
+    )
+    conn.commit()
 
 init_user_db()
 
@@ -76,19 +143,14 @@ def create_user(username: str, password: str):
         )
         conn.commit()
     except sqlite3.IntegrityError:
+        conn.rollback()
         raise ValueError('Username sudah digunakan')
-    finally:
-        conn.close()
 
 
 def get_user_by_username(username: str):
     conn = get_db_conn()
-    try:
-        cur = conn.execute('SELECT * FROM users WHERE username = ?', (username,))
-        row = cur.fetchone()
-        return row
-    finally:
-        conn.close()
+    cur = conn.execute('SELECT * FROM users WHERE username = ?', (username,))
+    return cur.fetchone()
 
 
 def login_required(f):
@@ -104,51 +166,50 @@ def login_required(f):
 # Utilities
 # -----------------------------
 
+@lru_cache(maxsize=4096)
 def allowed_file(filename):
-    """Check if file extension is allowed"""
+    """Check if file extension is allowed.
+
+    Memoized: this runs for every entry on every file listing, and the
+    same names come back request after request.
+    """
     if not filename or '.' not in filename:
-        print(f"Invalid filename: {filename}")
         return False
-    
-    ext = filename.rsplit('.', 1)[1].lower()
-    is_allowed = ext in ALLOWED_EXTENSIONS
-    
-    if not is_allowed:
-        print(f"Unsupported file type: {filename} (allowed: {', '.join(ALLOWED_EXTENSIONS)})")
-        
-    return is_allowed
+    return filename.rsplit('.', 1)[1].lower() in ALLOWED_EXTENSIONS
 
 
 def get_file_list():
     """Get list of files in the data folder"""
     files = []
     if os.path.exists(UPLOAD_FOLDER):
-        for filename in os.listdir(UPLOAD_FOLDER):
-            if allowed_file(filename):
-                file_path = os.path.join(UPLOAD_FOLDER, filename)
-                file_size = os.path.getsize(file_path)
-                files.append({
-                    'name': filename,
-                    'size': file_size,
-                    'size_mb': round(file_size / (1024 * 1024), 2)
-                })
+        # One scandir pass: the is_file() check is free via d_type and
+        # each entry costs a single stat for its size
+        with os.scandir(UPLOAD_FOLDER) as it:
+            for entry in it:
+                if entry.is_file() and allowed_file(entry.name):
+                    file_size = entry.stat().st_size
+                    files.append({
+                        'name': entry.name,
+                        'size': file_size,
+                        'size_mb': round(file_size / (1024 * 1024), 2)
+                    })
     return sorted(files, key=lambda x: x['name'])
 
 
 def get_unique_filename(original_filename):
     """Generate unique filename by adding timestamp if file exists"""
     from datetime import datetime
-    name, ext = os.path.splitext(original_filename)
     filename = secure_filename(original_filename)
     filepath = os.path.join(app.config['UPLOAD_FOLDER'], filename)
-    
+
     if not os.path.exists(filepath):
         return filename
-        
-    # Add timestamp to filename
+
+    # Add timestamp to filename; it is appended to the already-sanitized
+    # name, so a second secure_filename pass is unnecessary
+    name, ext = os.path.splitext(filename)
     timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-    new_filename = f"{name}_{timestamp}{ext}"
-    return secure_filename(new_filename)
+    return f"{name}_{timestamp}{ext}"
 
 # -----------------------------
 # Auth Routes
@@ -266,27 +327,48 @@ def upload_file():
     
     success_count = 0
     error_count = 0
-    
+
+    # Write all files in parallel; the streams must be consumed before the
+    # request ends, so wait for the saves (but not for re-indexing)
+    futures = {}
     for file in files:
         try:
-            filename = get_unique_filename(file.filename)
-            file_path = os.path.join(app.config['UPLOAD_FOLDER'], filename)
-            file.save(file_path)
-            success_count += 1
-            print(f"Saved file: {filename}")
+            filename, dst = _reserve_upload_path(file.filename)
+            futures[executor.submit(_save_upload, file, dst)] = (filename, dst)
         except Exception as e:
             error_count += 1
             print(f"Error saving {file.filename}: {e}")
-            
-    # Only rebuild index if files were successfully uploaded
+
+    done, not_done = wait(futures, timeout=120)
+    for future in done:
+        filename, _ = futures[future]
+        if future.exception() is None:
+            success_count += 1
+            print(f"Saved file: {filename}")
+        else:
+            error_count += 1
+            print(f"Error saving {filename}: {future.exception()}")
+
+    # Fence stragglers: queued saves are cancelled and their reserved
+    # names released; a save already running fails once werkzeug closes
+    # the request's temp files and then cleans up its own partial output
+    for future in not_done:
+        filename, dst = futures[future]
+        if future.cancel():
+            try:
+                dst.close()
+                os.remove(dst.name)
+            except OSError:
+                pass
+        print(f"Save timed out: {filename}")
+    error_count += len(not_done)
+
+    # Rebuild in the background; queries keep using the current index
+    # until the reload swaps in the new one
     if success_count > 0:
-        try:
-            print("Rebuilding search index...")
-            search_engine.reload_documents()
-            flash(f'Berhasil mengunggah {success_count} file dan memperbarui indeks.', 'success')
-        except Exception as e:
-            flash(f'File terunggah tetapi gagal memperbarui indeks: {str(e)}', 'warning')
-            
+        executor.submit(_rebuild_index)
+        flash(f'Berhasil mengunggah {success_count} file; indeks diperbarui di latar belakang.', 'success')
+
     if error_count > 0:
         flash(f'Gagal mengunggah {error_count} file.', 'error')
     
@@ -310,7 +392,8 @@ def delete_file(filename):
             return redirect(url_for('index'))
         
         os.remove(file_path)
-        search_engine.reload_documents()
+        # Row-drop plus IDF rescale; no need to re-read the whole corpus
+        search_engine.remove_file(filename)
         
         flash(f'File "{filename}" deleted successfully!', 'success')
         
@@ -347,9 +430,9 @@ def delete_all_files():
                 print(f"Error deleting {filename}: {e}")
                 errors += 1
 
-        # Reload index after deletion
+        # Empty the index in place; nothing is left to re-vectorize
         try:
-            search_engine.reload_documents()
+            search_engine.remove_all_files()
         except Exception as e:
             flash(f'File dihapus tetapi gagal memperbarui indeks: {str(e)}', 'warning')
             return redirect(url_for('index'))
@@ -401,17 +484,19 @@ def api_search():
                 'error': 'Query is required'
             }), 400
         
-        results = search_engine.search(query, top_n=top_n)
-        
-        # Format results for JSON response
-        formatted_results = []
-        for filename, content, score in results:
-            formatted_results.append({
+        # Results already carry previews truncated to the requested
+        # length, so formatting is a single pass with no re-slicing
+        results = search_engine.search(query, top_n=top_n, preview_len=200)
+
+        formatted_results = [
+            {
                 'filename': filename,
-                'content_preview': content[:200] + '...' if len(content) > 200 else content,
+                'content_preview': preview,
                 'score': round(score, 4)
-            })
-        
+            }
+            for filename, preview, score in results
+        ]
+
         return jsonify({
             'success': True,
             'query': query,